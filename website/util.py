@@ -20,8 +20,12 @@ def is_categorical_column(series: pd.Series) -> bool:
 
 
 def is_list_column(series: pd.Series) -> bool:
-    """Check if a column contains lists of items."""
-    return all(series.dropna().apply(lambda x: isinstance(x, list)))
+    """Check if a column contains lists of items.
+
+    Only the first non-null item is checked, as list columns are created in their entirety by splitting strings.
+    """
+    non_null = series.dropna()
+    return not non_null.empty and isinstance(non_null.iloc[0], list)
 
 
 def nan_filter(col: pd.Series) -> pd.Series:
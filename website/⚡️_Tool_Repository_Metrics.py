@@ -13,7 +13,6 @@ import git
 import markdown
 import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 import util
@@ -33,15 +32,17 @@ COLUMN_NAME_MAPPING: dict[str, str] = {
     "language": "Language",
 }
 
+# Counts are stored in the smallest unsigned integer type that can hold them.
+# This only applies to counts with no missing data, the rest are left as 64-bit floats.
 COLUMN_DTYPES: dict[str, Callable] = {
     "created_at": pd.to_datetime,
     "updated_at": pd.to_datetime,
-    "stargazers_count": pd.to_numeric,
-    "commit_stats.total_committers": pd.to_numeric,
-    "commit_stats.dds": lambda x: 100 * pd.to_numeric(x),
-    "forks_count": pd.to_numeric,
-    "dependent_repos_count": pd.to_numeric,
-    "last_month_downloads": pd.to_numeric,
+    "stargazers_count": lambda x: pd.to_numeric(x, downcast="unsigned"),
+    "commit_stats.total_committers": lambda x: pd.to_numeric(x, downcast="unsigned"),
+    "commit_stats.dds": lambda x: 100 * pd.to_numeric(x, downcast="float"),
+    "forks_count": lambda x: pd.to_numeric(x, downcast="unsigned"),
+    "dependent_repos_count": lambda x: pd.to_numeric(x, downcast="unsigned"),
+    "last_month_downloads": lambda x: pd.to_numeric(x, downcast="unsigned"),
     "category": lambda x: x.str.split(","),
 }
 
@@ -72,10 +73,49 @@ COLUMN_HELP: dict[str, str] = {
 
 EXTRA_COLUMNS = ["name_with_url", "Docs", "Score", "Interactions"]
 DEFAULT_ORDER = "Stars"
+SCORE_RANGE = (0, 100)
+
+# Table display configuration, with columns displayed in the order they are given here.
+COLUMN_CONFIG: dict[str, dict | None] = {
+    "name_with_url": st.column_config.LinkColumn(
+        "Tool Name",
+        help="Click on the tool name to navigate to its source code repository.",
+        display_text=".*#(.*)",
+    ),
+    "Docs": st.column_config.LinkColumn(
+        "Docs", display_text="📖", help=COLUMN_HELP["Docs"]
+    ),
+    "Score": st.column_config.ProgressColumn(
+        "Score",
+        min_value=SCORE_RANGE[0],
+        max_value=SCORE_RANGE[1],
+        format="%.0f%%",
+        help=COLUMN_HELP["Score"],
+    ),
+    # Placeholder, as the y-axis limit depends on the data. This is set in `main`.
+    "Interactions": None,
+    **{
+        col: st.column_config.DateColumn(col, help=COLUMN_HELP[col])
+        for col in ["Created", "Updated"]
+    },
+    **{
+        col: st.column_config.NumberColumn(col, help=COLUMN_HELP[col], format=fmt)
+        for col, fmt in NUMBER_FORMAT.items()
+    },
+    "Category": st.column_config.ListColumn("Category", help=COLUMN_HELP["Category"]),
+    "Language": st.column_config.TextColumn("Language", help=COLUMN_HELP["Language"]),
+}
+_cols_missing_config = set(COLUMN_CONFIG.keys()).symmetric_difference(
+    EXTRA_COLUMNS + list(COLUMN_NAME_MAPPING.values())
+)
+assert not _cols_missing_config, (
+    f"Missing column configuration for {_cols_missing_config}"
+)
+
 NOT_OPEN_SOURCE_LANGUAGES = ["gams", "matlab", "jetbrains mps", "powerbuilder", "ampl"]
 
 
-@st.cache_data
+@st.cache_data(show_spinner="Loading tool inventory…")
 def create_vis_table(tool_stats_dir: Path, user_stats_dir: Path) -> pd.DataFrame:
     """Create the tool table with columns renamed and filtered ready for visualisation.
 
@@ -86,9 +126,11 @@ def create_vis_table(tool_stats_dir: Path, user_stats_dir: Path) -> pd.DataFrame
     Returns:
         pd.DataFrame: Filtered and column renamed tool table.
     """
-    stats_df = pd.read_csv(tool_stats_dir / "stats.csv", index_col="id")
-    tools_df = pd.read_csv(tool_stats_dir / "filtered.csv", index_col="id")
-    docs_df = pd.read_csv(tool_stats_dir / "docs.csv", index_col="id")
+    # The pyarrow CSV parser is multi-threaded and infers datetime columns directly.
+    read_kwargs = {"index_col": "id", "engine": "pyarrow"}
+    stats_df = pd.read_csv(tool_stats_dir / "stats.csv", **read_kwargs)
+    tools_df = pd.read_csv(tool_stats_dir / "filtered.csv", **read_kwargs)
+    docs_df = pd.read_csv(tool_stats_dir / "docs.csv", **read_kwargs)
 
     df = pd.merge(left=stats_df, right=tools_df, right_index=True, left_index=True)
     df["Interactions"] = (
@@ -99,13 +141,18 @@ def create_vis_table(tool_stats_dir: Path, user_stats_dir: Path) -> pd.DataFrame
 
     # Assume: projects categorised as "Jupyter Notebook" are actually Python projects.
     # This occurs because the repository language is based on number of lines and Jupyter Notebooks have _a lot_ of lines.
+    # We store it as a categorical column, so the unique set of languages is known without having to scan the column.
     df["language"] = (
-        df.language.replace({"Jupyter Notebook": "Python"}).str.lower().astype("string")
+        df.language.replace({"Jupyter Notebook": "Python"})
+        .str.lower()
+        .astype("category")
     )
 
     # Add the tool name to the end of the URL after a `#`.
     # This allows us to use regex to show the tool name in a streamlit "link column" while still making the URL valid to direct users to the source code.
     df["name_with_url"] = df.url + "#" + df.name.apply(lambda x: x.split(",")[0])
+    # Lower-case copy of the above to search on, stored as pyarrow strings for fast substring matching.
+    df["search_key"] = df.name_with_url.str.lower().astype("string[pyarrow]")
 
     for col, dtype_func in COLUMN_DTYPES.items():
         df[col] = dtype_func(df[col])
@@ -115,16 +162,67 @@ def create_vis_table(tool_stats_dir: Path, user_stats_dir: Path) -> pd.DataFrame
         .fillna(docs_df["wiki"])
         .fillna(df["homepage"])
     )
-    df["Score"] = pd.Series(
-        np.random.choice([0, 100], size=len(df.index)), index=df.index
-    )
+    # Placeholder, to be populated in the app by `update_score_col` using the user-defined weightings.
+    df["Score"] = np.nan
     df_vis = df.rename(columns=COLUMN_NAME_MAPPING)[
-        EXTRA_COLUMNS + list(COLUMN_NAME_MAPPING.values())
+        EXTRA_COLUMNS + list(COLUMN_NAME_MAPPING.values()) + ["search_key"]
     ]
 
     return df_vis
 
 
+@st.cache_data(show_spinner=False)
+def column_metadata(tool_stats_dir: Path, user_stats_dir: Path) -> dict[str, dict]:
+    """Pre-compute metadata of the filterable tool table columns.
+
+    The tool table does not change between app reruns, so we only need to inspect its columns once.
+    We cache on the table data directories rather than the table itself to avoid streamlit having to hash the table on every rerun.
+
+    Args:
+        tool_stats_dir (Path): The directory in which to find tool list and stats.
+        user_stats_dir (Path): The directory in which to find tool user stats.
+
+    Returns:
+        dict[str, dict]:
+            For each column, the `kind` of data it holds (one of "datetime", "numeric", "categorical", "list", or None if it cannot be filtered on),
+            the number of `missing` values, and either its `min` / `max` values and `dist` histogram table (datetime / numeric columns)
+            or its `unique` values (categorical / list columns).
+    """
+    df = create_vis_table(tool_stats_dir, user_stats_dir)
+    metadata = {}
+    for col in ["Docs"] + list(COLUMN_NAME_MAPPING.values()):
+        series = df[col]
+        col_metadata: dict = {"kind": None, "missing": int(series.isnull().sum())}
+        if util.is_datetime_column(series):
+            col_metadata.update(
+                kind="datetime",
+                min=series.min(),
+                max=series.max(),
+                # Histogram of POSIX timestamps, to match the slider range used in `dist_plot`.
+                dist=_distribution_table(
+                    (series - pd.Timestamp(0, tz=series.dt.tz)).dt.total_seconds()
+                ),
+            )
+        elif util.is_numeric_column(series):
+            col_metadata.update(
+                kind="numeric",
+                # Streamlit sliders only accept python numbers, not numpy scalars of any precision.
+                min=series.min().item(),
+                max=series.max().item(),
+                dist=_distribution_table(series),
+            )
+        elif util.is_categorical_column(series):
+            # Categories are sorted on creation and this is a no-op if the column is already categorical.
+            categories = series.astype("category").cat.categories
+            col_metadata.update(kind="categorical", unique=categories.tolist())
+        elif util.is_list_column(series):
+            col_metadata.update(
+                kind="list", unique=sorted(series.explode().dropna().unique())
+            )
+        metadata[col] = col_metadata
+    return metadata
+
+
 def _create_user_interactions_timeseries(
     tool_data_dir: Path, resolution: str = "7d", n_months: int = 6
 ) -> pd.Series:
@@ -223,6 +321,8 @@ def list_filter(col: pd.Series, to_filter: Iterable) -> pd.Series:
     """Filter list columns.
 
     Dataframes shouldn't really be holding lists so this is a bit of a hack.
+    We explode the lists to one item per row so that we can filter on all items at once,
+    then collapse back to one row per tool.
 
     Args:
         col (pd.Series): Column to filter.
@@ -231,14 +331,8 @@ def list_filter(col: pd.Series, to_filter: Iterable) -> pd.Series:
     Returns:
         pd.Series: Filtered `col`.
     """
-    with pd.option_context("future.no_silent_downcasting", True):
-        return (
-            col.dropna()
-            .apply(lambda x: any(i in x for i in to_filter))
-            .reindex(col.index)
-            .fillna(True)
-            .infer_objects()
-        )
+    item_in_filter = col.explode().isin(set(to_filter))
+    return item_in_filter.groupby(level=0, sort=False).any() | col.isna()
 
 
 def add_scoring(cols: list[str]) -> float:
@@ -286,11 +380,15 @@ def update_score_col(df: pd.DataFrame) -> pd.Series:
         pd.Series: Tool score.
     """
     # Add tool score by combining metrics with the provided weightings
-    scores = {col: util.get_state(f"scoring_{col}", 0.5) for col in df.columns}
+    weights = np.array(
+        [util.get_state(f"scoring_{col}", 0.5) for col in df.columns], dtype=float
+    )
+    weights /= weights.sum() or 1.0
     scoring_method = util.get_state("scoring_method", "min-max")
     normalised_data = normalise(df, scoring_method)
-    score = normalised_data.mul(scores).div(sum(scores.values())).sum(axis=1).mul(100)
-    return score
+    # Missing metrics do not contribute to the score.
+    score = np.nan_to_num(normalised_data.to_numpy()) @ weights * 100
+    return pd.Series(score, index=df.index)
 
 
 def normalise(
@@ -306,20 +404,27 @@ def normalise(
         pd.DataFrame: `df` with each column scaled.
     """
     if scaling_method == "min-max":
-        return (df - df.min()) / (df.max() - df.min())
+        df_min = df.min()
+        return (df - df_min) / (df.max() - df_min)
     elif scaling_method == "rank":
-        return df.rank() / df.rank().max()
+        ranked = df.rank()
+        return ranked / ranked.max()
 
 
 def slider(
-    col: pd.Series, reset_mode: bool, plot_dist: bool = True
+    col: pd.Series,
+    col_range: tuple[float, float] | tuple[pd.Timestamp, pd.Timestamp],
+    reset_mode: bool,
+    dist_table: pd.DataFrame | None = None,
 ) -> tuple[float, float] | tuple[datetime.date, datetime.date]:
     """Generate a slider for numeric / datetime table data.
 
     Args:
         col (pd.Series): Data table column.
+        col_range (tuple[float, float] | tuple[pd.Timestamp, pd.Timestamp]): Min/max values of the data table column.
         reset_mode (bool): Whether to reset slider to initial values.
-        plot_dist (bool): If True, add a distribution plot of the column's data above the slider.
+        dist_table (pd.DataFrame | None, optional):
+            If given, add a distribution plot of the column's data above the slider using this histogram table. Defaults to None.
 
     Returns:
         tuple[float, float] | tuple[datetime.date, datetime.date]:
@@ -328,20 +433,19 @@ def slider(
     """
     state_name = f"slider_{col.name}"
     if col.dtype.kind == "M":
-        default_range = (col.min().date(), col.max().date())
+        default_range = (col_range[0].date(), col_range[1].date())
     else:
-        default_range = (col.min(), col.max())
+        default_range = col_range
     current_range = (
         default_range if reset_mode else util.get_state(state_name, default_range)
     )
     if col.dtype.kind == "M":
         slider_range = tuple(pd.Timestamp(i).timestamp() for i in current_range)
-        col = col.apply(lambda x: x.timestamp())
     else:
         slider_range = current_range
 
-    if plot_dist:
-        dist_plot(col, slider_range)
+    if dist_table is not None:
+        dist_plot(col.name, dist_table, slider_range)
 
     selected_range = st.sidebar.slider(
         f"Range for {col.name}",
@@ -429,19 +533,20 @@ def reset(button_press: bool = False) -> bool:
     return reset_mode
 
 
-def header_and_missing_value_toggle(col: pd.Series, reset_mode: bool) -> bool:
+def header_and_missing_value_toggle(
+    name: str, missing_count: int, reset_mode: bool
+) -> bool:
     """Create sidebar subheader and missing value toggle for a column.
 
     Args:
-        col (pd.Series): Stats table column.
+        name (str): Stats table column name.
+        missing_count (int): Number of missing values in the stats table column.
         reset_mode (bool): Whether to reset multiselect to initial values.
 
     Returns:
         bool: True if there are NaN values and the missing value toggle is switched on.
     """
-    name: str = col.name  # type:ignore
     st.sidebar.subheader(name, help=COLUMN_HELP[name])
-    missing_count = col.isnull().sum()
     state_name = f"exclude_nan_{name}"
     if missing_count > 0:
         exclude_nan = st.sidebar.toggle(
@@ -474,11 +579,10 @@ def proprietary_language_toggle(reset_mode: bool) -> bool:
     return exclude_proprietary
 
 
-@st.cache_data
 def _distribution_table(col: pd.Series, bins: int = 30) -> pd.DataFrame:
     """Pre-compute histogram representing the distribution of values for each numeric column of the tool stats table.
 
-    This reduces the calculation complexity on re-running the streamlit app.
+    This reduces the calculation complexity on re-running the streamlit app when called as part of generating the (cached) column metadata.
 
     Args:
         col (pd.Series): Numeric column of the tool stats table.
@@ -489,11 +593,12 @@ def _distribution_table(col: pd.Series, bins: int = 30) -> pd.DataFrame:
     """
     y, x = np.histogram(col.dropna(), bins=bins)
     # bin edges to midpoint
-    x = [(a + b) / 2 for a, b in zip(x, x[1:])]
+    x = 0.5 * (x[:-1] + x[1:])
 
     return pd.DataFrame({"x": x, "y": y})
 
 
+@st.cache_resource(show_spinner=False, max_entries=100)
 def _plotly_plot(df: pd.DataFrame) -> go.Figure:
     """Create a static plotly bar plot.
 
@@ -501,47 +606,51 @@ def _plotly_plot(df: pd.DataFrame) -> go.Figure:
     The resulting figure will have no interactivity.
     These plots are meant to be updated by user-induced changes that are passed by streamlit in the form of changes to the dataframe.
 
+    Most app reruns are triggered by widgets other than the slider linked to a plot, so we cache the figures to avoid recreating them.
+    Cached figures are shared between user sessions and must not be mutated.
+
     Args:
         df (pd.DataFrame): Data to plot, with "x", "y", and "color" columns
 
     Returns:
         go.Figure: Plotly figure.
     """
-    fig = px.bar(
-        df,
-        x="x",
-        y="y",
-        color="color",
-        color_discrete_map={"in": "#FF4B4B", "out": "#A3A8B8"},
+    # We use plotly graph objects directly as plotly express adds a lot of overhead to generate such a simple plot.
+    fig = go.Figure(
+        go.Bar(
+            x=df.x,
+            y=df.y,
+            marker_color=df.color.map({"in": "#FF4B4B", "out": "#A3A8B8"}),
+            hoverinfo="skip",
+            hovertemplate=None,
+        )
     )
     fig.update_layout(
-        yaxis_title=None,
         yaxis={"visible": False, "range": (0, df.y.max())},
         xaxis={"visible": False},
         margin={"b": 0, "t": 0},
         bargap=0,
         showlegend=False,
         height=100,
-        title="",
         plot_bgcolor="rgba(0,0,0,0)",
         paper_bgcolor="rgba(0,0,0,0)",
     )
-    fig.update_traces(hoverinfo="skip", hovertemplate=None)
     return fig
 
 
-def dist_plot(col: pd.Series, slider_range: tuple[float, float]) -> None:
+def dist_plot(
+    name: str, df_dist: pd.DataFrame, slider_range: tuple[float, float]
+) -> None:
     """Create a distribution plot in the sidebar.
 
     Args:
-        col (pd.Series): Column of data linked to the distribution data table.
+        name (str): Name of the column of data linked to the distribution data table.
+        df_dist (pd.DataFrame): Distribution data table, as generated by `_distribution_table`.
         slider_range (tuple[float, float]): Min/max defined by the user-defined slider values.
     """
-    df_dist = _distribution_table(col)
-    df_dist["color"] = [
-        "in" if ((i >= slider_range[0]) & (i <= slider_range[1])) else "out"
-        for i in df_dist.x
-    ]
+    x = df_dist.x.to_numpy()
+    in_range = (x >= slider_range[0]) & (x <= slider_range[1])
+    df_dist["color"] = np.where(in_range, "in", "out")
     fig = _plotly_plot(df_dist)
 
     config = {"displayModeBar": False, "staticPlot": True}
@@ -549,7 +658,7 @@ def dist_plot(col: pd.Series, slider_range: tuple[float, float]) -> None:
         fig,
         selection_mode=[],
         use_container_width=True,
-        key=f"{col.name}_chart",
+        key=f"{name}_chart",
         config=config,
     )
 
@@ -574,6 +683,23 @@ def create_filter_message() -> str:
     return message
 
 
+@st.cache_data(show_spinner=False)
+def get_latest_changes(filepath: Path, last_modified: float) -> str:
+    """Get the date of the most recent git commit to a file.
+
+    Calling git requires a subprocess, so we cache the result and only re-run it if the file has been modified.
+
+    Args:
+        filepath (Path): Path to the git-tracked file.
+        last_modified (float): File modification timestamp, used only to invalidate the cache when the file changes.
+
+    Returns:
+        str: Commit date in `YYYY-MM-DD` format.
+    """
+    g = git.cmd.Git()
+    return g.log("-1", "--pretty=%cs", filepath)
+
+
 def extract_processing_approach_from_readme(readme: Path, header: str) -> str:
     """Extract all HTML text from the README below a given (sub)header.
 
@@ -701,112 +827,103 @@ def conclusion():
     )
 
 
-def main(df: pd.DataFrame):
+def main(df: pd.DataFrame, col_metadata: dict[str, dict]):
     """Main streamlit app generator.
 
     Args:
         df (pd.DataFrame): Table to display in app.
+        col_metadata (dict[str, dict]): Metadata of filterable table columns, as generated by `column_metadata`.
     """
     reset_mode = reset()
     st.sidebar.header("Table filters", divider=True)
 
     util.set_state("filters", {"toggle": [], "multiselect": [], "slider": []})
 
-    col_config = {}
     numeric_cols = []
-    filters = []
+    # Tools to keep in view, updated by each filter in turn.
+    mask = pd.Series(True, index=df.index)
     # Show missing data info and toggle for docs column
-    exclude_nan = header_and_missing_value_toggle(df["Docs"], reset_mode)
+    exclude_nan = header_and_missing_value_toggle(
+        "Docs", col_metadata["Docs"]["missing"], reset_mode
+    )
     if exclude_nan:
-        filters.append(util.nan_filter(df["Docs"]))
+        mask &= util.nan_filter(df["Docs"])
 
     # Add score filtering first.
     st.sidebar.subheader("Score", help=COLUMN_HELP["Score"])
-    score_slider_range = slider(df["Score"], reset_mode, plot_dist=False)
+    score_slider_range = slider(df["Score"], SCORE_RANGE, reset_mode)
 
     for col in COLUMN_NAME_MAPPING.values():
+        metadata = col_metadata[col]
         # Show missing data info and toggle for each column
-        exclude_nan = header_and_missing_value_toggle(df[col], reset_mode)
+        exclude_nan = header_and_missing_value_toggle(
+            col, metadata["missing"], reset_mode
+        )
         if exclude_nan:
-            filters.append(util.nan_filter(df[col]))
-
-        if util.is_datetime_column(df[col]):
-            slider_range = slider(df[col], reset_mode)
-            filters.append(date_range_filter(df[col], *slider_range))
-            col_config[col] = st.column_config.DateColumn(col, help=COLUMN_HELP[col])
-
-        elif util.is_numeric_column(df[col]):
-            slider_range = slider(df[col], reset_mode)
+            mask &= util.nan_filter(df[col])
+
+        if metadata["kind"] == "datetime":
+            slider_range = slider(
+                df[col],
+                (metadata["min"], metadata["max"]),
+                reset_mode,
+                metadata["dist"],
+            )
+            mask &= date_range_filter(df[col], *slider_range)
+
+        elif metadata["kind"] == "numeric":
+            slider_range = slider(
+                df[col],
+                (metadata["min"], metadata["max"]),
+                reset_mode,
+                metadata["dist"],
+            )
 
-            filters.append(numeric_range_filter(df[col], *slider_range))
+            mask &= numeric_range_filter(df[col], *slider_range)
 
             numeric_cols.append(col)
-            col_config[col] = st.column_config.NumberColumn(
-                col, help=COLUMN_HELP[col], format=NUMBER_FORMAT[col]
-            )
 
-        elif util.is_categorical_column(df[col]):
+        elif metadata["kind"] == "categorical":
             # Categorical multiselect
-            unique_values = sorted(df[col].dropna().unique().tolist())
-            selected_values = multiselect(unique_values, col, reset_mode)
-            filters.append(categorical_filter(df[col], selected_values))
-            col_config[col] = st.column_config.TextColumn(col, help=COLUMN_HELP[col])
+            selected_values = multiselect(metadata["unique"], col, reset_mode)
+            mask &= categorical_filter(df[col], selected_values)
 
-        elif util.is_list_column(df[col]):
+        elif metadata["kind"] == "list":
             # Categorical multiselect with list column entry
-            unique_values = list(set(i for j in df[col].dropna().values for i in j))
-            selected_values = multiselect(unique_values, col, reset_mode)
-            filters.append(list_filter(df[col], selected_values))
-            col_config[col] = st.column_config.ListColumn(col, help=COLUMN_HELP[col])
+            selected_values = multiselect(metadata["unique"], col, reset_mode)
+            mask &= list_filter(df[col], selected_values)
 
     # Add tool score by combining metrics with the provided weightings
     df["Score"] = update_score_col(df[numeric_cols])
-    filters.append(numeric_range_filter(df["Score"], *score_slider_range))
+    mask &= numeric_range_filter(df["Score"], *score_slider_range)
 
     # Display options
     col1, col2 = st.columns([3, 2])
     with col2:
         search_result = st_keyup("Find a tool by name", value="", key="search_box")
-    filters.append(df["name_with_url"].str.lower().str.contains(search_result.lower()))
+    if search_result:
+        mask &= df["search_key"].str.contains(search_result.lower(), regex=False)
 
-    filter_series = pd.concat(filters, axis=1).all(axis=1)
-    df_filtered = df[filter_series].sort_values(DEFAULT_ORDER, ascending=False)
+    # Sort before taking the subset of the table so we only copy table data once.
+    sorted_index = df.loc[mask, DEFAULT_ORDER].sort_values(ascending=False).index
+    df_filtered = df.loc[
+        sorted_index, EXTRA_COLUMNS + list(COLUMN_NAME_MAPPING.values())
+    ]
 
     with col1:
         message = create_filter_message()
         st.metric(f"Tools in view{message}", f"{len(df_filtered)} / {len(df)}")
 
+    # Share the interactions bar chart y-axis limits between tools so they can be compared.
     max_interactions = df["Interactions"].dropna().apply(lambda x: x.max()).max()
-    col_config = {
-        "name_with_url": st.column_config.LinkColumn(
-            "Tool Name",
-            help="Click on the tool name to navigate to its source code repository.",
-            display_text=".*#(.*)",
-        ),
-        "Docs": st.column_config.LinkColumn(
-            "Docs", display_text="📖", help=COLUMN_HELP["Docs"]
-        ),
-        "Score": st.column_config.ProgressColumn(
-            "Score",
-            min_value=0,
-            max_value=100,
-            format="%.0f%%",
-            help=COLUMN_HELP["Score"],
-        ),
+    col_config = COLUMN_CONFIG | {
         "Interactions": st.column_config.BarChartColumn(
             "6 Month Interactions",
             y_min=0,
             y_max=max_interactions,
             help=COLUMN_HELP["Interactions"],
-        ),
-        **col_config,
+        )
     }
-    cols_missing_config = set(col_config.keys()).symmetric_difference(
-        EXTRA_COLUMNS + list(COLUMN_NAME_MAPPING.values())
-    )
-    assert not cols_missing_config, (
-        f"Missing column configuration for {cols_missing_config}"
-    )
     # Display the table
     if len(df_filtered) > 0:
         st.dataframe(
@@ -841,12 +958,13 @@ if __name__ == "__main__":
     )
 
     df_vis = create_vis_table(tool_stats_dir, user_stats_dir)
-    g = git.cmd.Git()
-    latest_changes = g.log("-1", "--pretty=%cs", tool_stats_dir / "stats.csv")
+    stats_path = tool_stats_dir / "stats.csv"
+    latest_changes = get_latest_changes(stats_path, stats_path.stat().st_mtime)
 
     data_processing_approach_string = extract_processing_approach_from_readme(
         readme_path, "Our data processing approach"
     )
     preamble(latest_changes, len(df_vis), data_processing_approach_string)
-    main(df_vis.copy())
+    # No need to copy `df_vis` before it is updated in `main`, as `st.cache_data` returns a new copy on every call.
+    main(df_vis, column_metadata(tool_stats_dir, user_stats_dir))
     conclusion()